@@ -29,6 +29,7 @@ from .time.methods import (ForwardEulerS1P1,
                            ExpRalstonS2P2,
                            RK3KuttaS3P3,
                            RK4ClassicalS4P4,
+                           CarpenterKennedyLowStorageS5P4,
                            BogackiShampineS4P3Q2,
                            ZonneveldS5P4Q3,
                            ExpKennedyCarpetnerS6P4Q3,
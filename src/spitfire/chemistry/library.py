@@ -15,7 +15,20 @@ import numpy as np
 import pickle as pickle
 from copy import copy, deepcopy
 import shutil
+import json
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _json_default(obj):
+    """Convert NumPy data in extra attributes to types the json module can serialize"""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    elif isinstance(obj, np.generic):
+        return obj.item()
+    else:
+        return str(obj)
 
 
 class Dimension(object):
@@ -29,11 +42,16 @@ class Dimension(object):
         the name of the mechanism - hyphens and spaces may not be used here, use underscore separators
     values: np.array
         the values of the independent variable in the grid
+    log_scaled: bool
+        whether or not the independent variable is log-scaled (default: False)
+    copy: bool
+        whether or not to copy the values (default: True), set this to False to take ownership of an array
+        that is not used elsewhere
     """
 
-    def __init__(self, name: str, values: np.array, log_scaled=False):
-        self._name = name
-        self._values = np.copy(values)
+    def __init__(self, name: str, values: np.array, log_scaled=False, copy=True):
+        self._name = sys.intern(str(name))
+        self._values = np.copy(values) if copy else np.asarray(values)
         self._min = np.min(values)
         self._max = np.max(values)
         self._npts = values.size
@@ -87,11 +105,30 @@ class Dimension(object):
     def _get_dict_for_file_save(self):
         return {'name': self._name, 'values': self._values, 'log_scaled': self._log_scaled}
 
+    def _slice(self, s):
+        """Obtain a new Dimension over values[s], a view for slices, skipping the validation of the already valid values"""
+        values = self._values[s] if isinstance(s, slice) else np.atleast_1d(self._values[s])
+        new_dimension = Dimension.__new__(Dimension)
+        new_dimension._name = self._name
+        new_dimension._values = values
+        new_dimension._min = np.min(values)
+        new_dimension._max = np.max(values)
+        new_dimension._npts = values.size
+        new_dimension._log_scaled = self._log_scaled
+        return new_dimension
+
 
 class LibraryIndexError(IndexError):
     pass
 
 
+# Dimension attributes that a Library mirrors as [dimension_name]_name, [dimension_name]_values, etc.
+_DIMENSION_MIRRORED_ATTRIBUTES = ('_name', '_values', '_min', '_max', '_npts', '_log_scaled')
+
+# suffix of the extra attribute holding the scale, offset, and type of a quantized property
+_QUANTIZATION_SUFFIX = '__qmeta'
+
+
 class Library(object):
     """A container class for tabulated datasets over structured grids.
 
@@ -101,7 +138,8 @@ class Library(object):
       library.[dimension_name]_min
       library.[dimension_name]_max
       library.[dimension_name]_npts
-      library.[dimension_name]_grid = multidimensional meshgrid of the data
+      library.[dimension_name]_log_scaled
+      library.[dimension_name]_grid = multidimensional meshgrid of the data, a read-only broadcast view of the values
 
     **Constructor**: specify the argument list of dimensions defining the grid
 
@@ -113,30 +151,48 @@ class Library(object):
     """
 
     def _set_grid(self):
-        grid = np.meshgrid(*[self._dims[d].values for d in self._dims], indexing='ij')
-        self._grid_shape = grid[0].shape
-        self._grid_size = grid[0].size
-
-        for i, d in enumerate(self._dims):
-            setattr(self, self._dims[d].name, d)
-            setattr(self, self._dims[d].name + '_grid', np.copy(grid[i]))
-            for a in self._dims[d].__dict__:
-                setattr(self, self._dims[d].name + a, getattr(self._dims[d], a))
+        self._dims_ordered = tuple(self._dims[self._dims_ordering[i]] for i in self._dims_ordering)
+
+        # each grid broadcasts the one-dimensional values across the other dimensions instead of materializing a meshgrid
+        self._grid_shape = tuple(d.npts for d in self._dims_ordered)
+        self._grid_size = int(np.prod(self._grid_shape))
+        ndim = len(self._grid_shape)
+
+        self_dict = self.__dict__
+        for i, d in enumerate(self._dims_ordered):
+            name = d._name
+            d_dict = d.__dict__
+            view_shape = [1] * ndim
+            view_shape[i] = d._npts
+            self_dict[name] = name
+            self_dict[name + '_grid'] = np.broadcast_to(d._values.reshape(view_shape), self._grid_shape)
+            for a in _DIMENSION_MIRRORED_ATTRIBUTES:
+                self_dict[name + a] = d_dict[a]
 
     def __init__(self, *dimensions):
-        self._dims = dict(
-            {d.name: (Dimension(d.name, d.values, d.log_scaled) if isinstance(d, Dimension) else Dimension(d[0], d[1], False if len(d) == 2 else d[2])) for d in
-             dimensions})
+        self._init_from_dimensions(
+            [Dimension(d.name, d.values, d.log_scaled) if isinstance(d, Dimension) else Dimension(d[0], d[1], False if len(d) == 2 else d[2]) for d in
+             dimensions])
+
+    def _init_from_dimensions(self, dimensions):
+        self._dims = dict({d.name: d for d in dimensions})
         self._props = dict()
-        self._dims_ordering = dict()
-        for i, d in enumerate(dimensions):
-            self._dims_ordering[i] = d.name
+        self._dims_ordering = dict({i: d.name for i, d in enumerate(dimensions)})
+        self._dims_ordered = tuple()
 
         if dimensions:
             self._set_grid()
 
         self._extra_attributes = dict()
 
+    @classmethod
+    def _from_dimensions(cls, dimensions):
+        """Build a library that takes ownership of a list of Dimension objects without copying them,
+            for internal use with dimensions that are already owned by a library and are never modified in place"""
+        library = cls.__new__(cls)
+        library._init_from_dimensions(dimensions)
+        return library
+
     def scale_dimension(self, dim_name, multiplier):
         try:
             self.remap_dimension(dim_name, lambda x: multiplier * x)
@@ -169,78 +225,149 @@ class Library(object):
         for index in instance_dict['dim_ordering']:
             name = instance_dict['dim_ordering'][index]
             d = instance_dict['dimensions'][name]
-            ordered_dims[index] = Dimension(d['name'], d['values'], log_scaled=(False if 'log_scaled' not in d else d['log_scaled']))
-        self.__init__(*ordered_dims)
+            ordered_dims[index] = Dimension(d['name'], d['values'],
+                                            log_scaled=(False if 'log_scaled' not in d else d['log_scaled']),
+                                            copy=False)
+        # the unpickled dimensions belong to this library alone, so take ownership of them instead of copying in __init__
+        self._init_from_dimensions(ordered_dims)
         for prop in instance_dict['properties']:
             self[prop] = instance_dict['properties'][prop]
-        ea = dict() if 'extra_attributes' not in instance_dict else instance_dict['extra_attributes']
-        for p in ea:
-            self.extra_attributes[p] = ea[p]
+        self._extra_attributes = dict(instance_dict.get('extra_attributes', dict()))
 
     def save_to_file(self, file_name):
         """Save a library to a specified file using pickle"""
         with open(file_name, 'wb') as file_output:
             pickle.dump(self, file_output)
 
-    def save_to_text_directory(self, output_directory, ravel_order='F', format='%.14e'):
-        """
-        Dump the contents of a library to a set of easy-to-process text files in a directory.
-        Note that file names of property bulk data files will have spaces replaced by underscores.
-        Note that the preferred method of saving data for later use with Spitfire is the save_to_file method,
-        which dumps compressed data with pickle, Python's native serialization tool. The Library.load_from_file method
-        can then be used to reload data into Python, which is significantly faster than loading from text files.
-        This method of dumping data does not natively support reloading data from the text files,
-        and is simply meant to provide data that is easy to load in other codes (e.g., C++, Fortran, or Matlab codes).
+    def save_to_npz(self, file_name, compressed=False):
+        """Save a library to a specified file with NumPy's .npz format, which does not rely on pickle.
+        Dimension values and properties are stored as separate arrays and the names, ordering, and extra attributes
+        are stored as JSON, so extra attributes should be JSON-serializable (NumPy arrays are saved as lists).
 
         Parameters
         ----------
-        output_directory: str
-            where to save the files (a new directory will be made, and an existing one will be removed with permission)
-        ravel_order: str
-            row-major ('C') or column-major ('F') flattening of multidimensional property arrays, default is 'F' for column-major,
-            which flattens the first dimension first, second dimension second, and so on
-        format: str
-            string format for numbers sent to NumPy savetxt function, default is '%.14e'
-
+        file_name: str
+            the name of the file to write, NumPy appends '.npz' if it is not given
+        compressed: bool
+            whether or not to compress the arrays with np.savez_compressed (default: False)
         """
+        metadata = dict(dimensions=[dict(name=d.name, log_scaled=d.log_scaled) for d in self._dims_ordered],
+                        properties=self.props,
+                        extra_attributes=self._extra_attributes)
+        arrays = dict(metadata=np.array(json.dumps(metadata, default=_json_default)))
+        for i, d in enumerate(self._dims_ordered):
+            arrays[f'ivar_{i}'] = d.values
+        for i, p in enumerate(self._props):
+            arrays[f'dvar_{i}'] = self._props[p]
+        (np.savez_compressed if compressed else np.savez)(file_name, **arrays)
+
+    def _save_to_directory(self, output_directory, method_name, save_array, extension, ravel_order):
         out_dir_exists = os.path.isdir(output_directory)
         proceed = input(
-            f'Library.save_to_text_directory(): remove existing directory {output_directory}? (y/any=no) ') if out_dir_exists else 'y'
+            f'Library.{method_name}(): remove existing directory {output_directory}? (y/any=no) ') if out_dir_exists else 'y'
 
         if proceed != 'y':
-            print('Library.save_to_text_directory(): cannot override existing output directory, aborting!')
+            print(f'Library.{method_name}(): cannot override existing output directory, aborting!')
             return
 
-        if out_dir_exists:
-            shutil.rmtree(output_directory)
+        # write everything into a sibling staging directory and only move it into place once it is complete,
+        # so an interrupted save never leaves a partial directory behind
+        output_directory = os.path.normpath(output_directory)
+        staging_directory = f'{output_directory}.tmp.{os.getpid()}'
+        os.mkdir(staging_directory)
+        old_directory = f'{output_directory}.old.{os.getpid()}'
+        try:
+            self._write_directory_contents(staging_directory, save_array, extension, ravel_order)
+            if out_dir_exists:
+                os.rename(output_directory, old_directory)
+                try:
+                    os.rename(staging_directory, output_directory)
+                except BaseException:
+                    os.rename(old_directory, output_directory)
+                    raise
+            else:
+                os.rename(staging_directory, output_directory)
+        except BaseException:
+            shutil.rmtree(staging_directory, ignore_errors=True)
+            raise
 
-        os.mkdir(output_directory)
+        if out_dir_exists:
+            shutil.rmtree(old_directory)
 
-        md_iv_file_name = os.path.join(output_directory, 'metadata_independent_variables.txt')
-        md_dv_file_name = os.path.join(output_directory, 'metadata_dependent_variables.txt')
-        md_ea_file_name = os.path.join(output_directory, 'metadata_user_defined_attributes.txt')
+    def _write_directory_contents(self, staging_directory, save_array, extension, ravel_order):
+        md_iv_file_name = os.path.join(staging_directory, 'metadata_independent_variables.txt')
+        md_dv_file_name = os.path.join(staging_directory, 'metadata_dependent_variables.txt')
+        md_ea_file_name = os.path.join(staging_directory, 'metadata_user_defined_attributes.txt')
         bd_prefix = 'bulkdata'
 
-        prop_names_underscored = dict({p: p.replace(' ', '_') for p in self.props})
+        prop_names_underscored = dict({p: p.replace(' ', '_') for p in self._props})
 
         with open(md_iv_file_name, 'w') as f:
-            for d in self.dims:
+            for d in self._dims_ordered:
                 f.write(d.name + '\n')
 
         with open(md_dv_file_name, 'w') as f:
-            for p in self.props:
+            for p in self._props:
                 f.write(prop_names_underscored[p] + '\n')
 
         with open(md_ea_file_name, 'w') as f:
-            f.write(str(self._extra_attributes))
+            json.dump(self._extra_attributes, f, default=_json_default)
+
+        tasks = [(os.path.join(staging_directory, f'{bd_prefix}_ivar_{d.name}.{extension}'), lambda d=d: d.values)
+                 for d in self._dims_ordered]
+        tasks += [(os.path.join(staging_directory, f'{bd_prefix}_dvar_{prop_names_underscored[p]}.{extension}'),
+                   lambda p=p: self._props[p].ravel(order=ravel_order)) for p in self._props]
+
+        # the files are independent and file I/O releases the GIL, so write them concurrently,
+        # flattening each array (which may copy it) within its task so that only a few copies exist at any time
+        with ThreadPoolExecutor(max_workers=max(1, min(len(tasks), os.cpu_count() or 1))) as executor:
+            list(executor.map(lambda task: save_array(task[0], task[1]()), tasks))
+
+    def save_to_text_directory(self, output_directory, ravel_order='F', format='%.14e'):
+        """
+        Dump the contents of a library to a set of easy-to-process text files in a directory.
+        Note that file names of property bulk data files will have spaces replaced by underscores.
+        Note that the preferred method of saving data for later use with Spitfire is the save_to_file method,
+        which dumps compressed data with pickle, Python's native serialization tool. The Library.load_from_file method
+        can then be used to reload data into Python, which is significantly faster than loading from text files.
+        This method of dumping data does not natively support reloading data from the text files,
+        and is simply meant to provide data that is easy to load in other codes (e.g., C++, Fortran, or Matlab codes).
+        The user-defined extra attributes are written as JSON, with NumPy arrays written as lists.
+        Formatting numbers as text is slow for large libraries, see save_to_binary_directory for a faster alternative.
 
-        for d in self.dims:
-            np.savetxt(os.path.join(output_directory, f'{bd_prefix}_ivar_{d.name}.txt'),
-                       d.values, fmt=format)
+        Parameters
+        ----------
+        output_directory: str
+            where to save the files (a new directory will be made, and an existing one will be removed with permission)
+        ravel_order: str
+            row-major ('C') or column-major ('F') flattening of multidimensional property arrays, default is 'F' for column-major,
+            which flattens the first dimension first, second dimension second, and so on
+        format: str
+            string format for numbers sent to NumPy savetxt function, default is '%.14e'
+
+        """
+        self._save_to_directory(output_directory, 'save_to_text_directory',
+                                lambda file_name, values: np.savetxt(file_name, values, fmt=format),
+                                'txt', ravel_order)
 
-        for p in self.props:
-            np.savetxt(os.path.join(output_directory, f'{bd_prefix}_dvar_{prop_names_underscored[p]}.txt'),
-                       self[p].ravel(order=ravel_order), fmt=format)
+    def save_to_binary_directory(self, output_directory, ravel_order='F'):
+        """
+        Dump the contents of a library to a directory in the same layout as save_to_text_directory,
+        except that the bulk data files are binary NumPy .npy files written with np.save instead of text files.
+        This avoids formatting every number as text, so it is much faster for large libraries,
+        and the files can be read with np.load (including memory-mapping with mmap_mode) or by other codes
+        through the simple .npy header format.
+
+        Parameters
+        ----------
+        output_directory: str
+            where to save the files (a new directory will be made, and an existing one will be removed with permission)
+        ravel_order: str
+            row-major ('C') or column-major ('F') flattening of multidimensional property arrays, default is 'F' for column-major,
+            which flattens the first dimension first, second dimension second, and so on
+
+        """
+        self._save_to_directory(output_directory, 'save_to_binary_directory', np.save, 'npy', ravel_order)
 
     @classmethod
     def load_from_file(cls, file_name):
@@ -255,26 +382,31 @@ class Library(object):
         else:
             return pickled_data
 
+    @classmethod
+    def load_from_npz(cls, file_name):
+        """Load a library from a specified .npz file (following save_to_npz)"""
+        with np.load(file_name) as data:
+            metadata = json.loads(str(data['metadata']))
+            library = cls._from_dimensions([Dimension(d['name'], data[f'ivar_{i}'], d['log_scaled'], copy=False)
+                                            for i, d in enumerate(metadata['dimensions'])])
+            for i, p in enumerate(metadata['properties']):
+                library[p] = data[f'dvar_{i}']
+        for ea in metadata['extra_attributes']:
+            library.extra_attributes[ea] = metadata['extra_attributes'][ea]
+        return library
+
     def __copy__(self):
-        new_dimensions = []
-        for d in self.dims:
-            new_d = Dimension(d.name, d.values, d.log_scaled)
-            new_dimensions.append(new_d)
-        new_library = Library(*new_dimensions)
-        for p in self.props:
-            new_library[p] = self[p]
+        new_library = Library._from_dimensions(self._dims_ordered)
+        for p in self._props:
+            new_library[p] = self._props[p]
         for ea in self.extra_attributes:
             new_library.extra_attributes[ea] = self.extra_attributes[ea]
         return new_library
 
     def __deepcopy__(self, *args, **kwargs):
-        new_dimensions = []
-        for d in self.dims:
-            new_d = Dimension(d.name, np.copy(d.values), d.log_scaled)
-            new_dimensions.append(new_d)
-        new_library = Library(*new_dimensions)
-        for p in self.props:
-            new_library[p] = np.copy(self[p])
+        new_library = Library(*self._dims_ordered)
+        for p in self._props:
+            new_library.set_property(p, self._props[p], copy=True)
         for ea in self.extra_attributes:
             new_library.extra_attributes[ea] = self.extra_attributes[ea]
         return new_library
@@ -299,35 +431,60 @@ class Library(object):
         new_dimensions = []
         for d in library.dims:
             if d.values.size > 1:
-                new_d = Dimension(d.name, d.values, d.log_scaled)
-                new_dimensions.append(new_d)
+                new_dimensions.append(d)
         if not new_dimensions:
-            return dict(properties=dict({p: np.squeeze(library[p]) for p in library.props}),
+            return dict(properties=dict({p: np.squeeze(library._props[p]) for p in library._props}),
                         dimensions=dict({d.name: (np.squeeze(d.values), d.log_scaled) for d in library.dims}),
                         extra_attributes=library.extra_attributes)
         else:
-            new_library = Library(*new_dimensions)
-            for p in library.props:
-                new_library[p] = np.squeeze(library[p])
+            new_library = Library._from_dimensions(new_dimensions)
+            for p in library._props:
+                new_library[p] = np.squeeze(library._props[p])
             for ea in library.extra_attributes:
                 new_library.extra_attributes[ea] = library.extra_attributes[ea]
             return new_library
 
     def __setitem__(self, quantity, values):
         """Use the bracket operator, as in lib['myprop'] = values, to add a property defined on the grid
-           The np.ndarray of values must be shaped correctly"""
+           The np.ndarray of values must be shaped correctly. A new property holds a view of the given array,
+           use set_property(quantity, values, copy=True) to give the library its own copy instead."""
+        self.set_property(quantity, values)
+
+    def _is_grid_view(self, values):
+        """Whether or not an array is a read-only broadcast view, like the grids of this or any other library"""
+        return not values.flags.writeable and (0 in values.strides or
+                                               any(np.may_share_memory(values, d.values) for d in self._dims_ordered))
+
+    def set_property(self, quantity, values, copy=False):
+        """Add or overwrite a property defined on the grid, as in lib[quantity] = values
+
+        Parameters
+        ----------
+        quantity: str
+            the name of the property
+        values: np.ndarray or float
+            the values of the property, which must be shaped like the grid if an array is given
+        copy: bool
+            whether or not a new property stores a copy of the array (default: False),
+            by default the library holds a view of the given array without copying it, except for read-only broadcast
+            views such as the library's grids, so lib['f'] = lib.x_grid stores a writeable copy
+            (other read-only arrays, such as memory-mapped files, are held as read-only views)
+        """
         if isinstance(values, np.ndarray):
             if values.shape != self._grid_shape:
                 raise ValueError(f'The shape of the "{quantity}" array does not conform to that of the library. '
                                  f'Given shape = {values.shape}, grid shape = {self._grid_shape}')
+            self._drop_quantization(quantity)
             if quantity not in self._props:
-                self._props[quantity] = values.view()
+                copy = copy or self._is_grid_view(values)
+                self._props[sys.intern(str(quantity))] = np.copy(values) if copy else values.view()
             else:
                 self._props[quantity][:] = values
         elif isinstance(values, float) or isinstance(values, int):
             values = float(values) if isinstance(values, int) else values
+            self._drop_quantization(quantity)
             if quantity not in self._props:
-                self._props[quantity] = self.get_empty_dataset()
+                self._props[sys.intern(str(quantity))] = self.get_empty_dataset()
             self._props[quantity].fill(values)
         else:
             raise TypeError(f'In Library[arg] = values, values must be a np.ndarray or float, received {values}')
@@ -342,38 +499,45 @@ class Library(object):
             methods from the Python copy package or on the Library class (l2 = Library.copy(l1), same for deepcopy)."""
 
         arg1 = slices[0]
-        if isinstance(arg1, str):
+        if type(arg1) is str or isinstance(arg1, str):
             if len(slices) == 1:
                 return self._props[arg1]
             else:
                 raise LibraryIndexError(f'Library[...] can either take a single string or standard Python slices, '
                                         f'you provided it {slices}')
         else:
+            dims = self._dims_ordered
+            ndims = len(dims)
             if isinstance(slices[0], slice):
                 slices = slices
-                if slices[0] == slice(None, None, None) and len(self.dims) > 1:
-                    slices = tuple([slice(None, None, None)] * len(self.dims))
+                if slices[0] == slice(None, None, None) and ndims > 1:
+                    slices = tuple([slice(None, None, None)] * ndims)
             else:
                 slices = slices[0]
 
-            if len(slices) != len(self.dims):
+            if len(slices) != ndims:
                 raise LibraryIndexError(
                     f'Library[...] slicing must be given the same number of arguments as there are dimensions, '
-                    f'you provided {len(slices)} slices to a Library of dimension {len(self.dims)}')
+                    f'you provided {len(slices)} slices to a Library of dimension {ndims}')
             new_dimensions = []
-            for d, s in zip(self.dims, slices):
+            for d, s in zip(dims, slices):
                 if not isinstance(s, slice) and not isinstance(s, int):
                     raise LibraryIndexError(f'Library[...] can either take a single string or standard Python slices, '
                                             f'you provided it {slices}')
-                new_d = Dimension(d.name, np.array([d.values[s]]) if isinstance(d.values[s], float) else d.values[s], d.log_scaled)
-                new_dimensions.append(new_d)
-            new_library = Library(*new_dimensions)
-            for p in self.props:
-                new_library[p] = self._props[p][slices].reshape(new_library.shape)
+                new_dimensions.append(d._slice(s))
+            new_library = Library._from_dimensions(new_dimensions)
+            new_shape = new_library.shape
+            props = self._props
+            for p in props:
+                new_library[p] = props[p][slices].reshape(new_shape)
             for ea in self.extra_attributes:
                 new_library.extra_attributes[ea] = self.extra_attributes[ea]
             return new_library
 
+    def get(self, name):
+        """Obtain the data for a property by name, equivalent to lib[name] but without any slicing checks"""
+        return self._props[name]
+
     def __contains__(self, prop):
         return prop in self._props
 
@@ -410,15 +574,12 @@ class Library(object):
     @property
     def dims(self):
         """Obtain the ordered list of the Dimension objects associated with the library"""
-        dims = []
-        for d in self._dims_ordering:
-            dims.append(self._dims[self._dims_ordering[d]])
-        return dims
+        return list(self._dims_ordered)
 
     @property
     def dim_names(self):
         """Obtain the ordered list of the Dimension object names"""
-        return [d.name for d in self.dims]
+        return [d.name for d in self._dims_ordered]
 
     def dim(self, name):
         """Obtain a Dimension object by name"""
@@ -430,9 +591,71 @@ class Library(object):
         return np.ndarray(self._grid_shape)
 
     def add_empty_property(self, name):
-        self._props[name] = self.get_empty_dataset()
+        self._props[sys.intern(str(name))] = self.get_empty_dataset()
 
     def remove(self, *quantities):
         """Remove quantities (argument list of strings) from the library"""
         for quantity in quantities:
             self._props.pop(quantity)
+            self._extra_attributes.pop(quantity + _QUANTIZATION_SUFFIX, None)
+
+    def quantize(self, quantity, dtype=np.float16):
+        """Store a property at reduced precision to cut its memory footprint and the memory traffic of lookups.
+        Floating-point types (np.float16, np.float32) simply cast the data, while unsigned integer types
+        (np.uint8, np.uint16) map the range of the data linearly onto the integer range.
+        The scale and offset of this mapping are stored in the extra attributes as [quantity]__qmeta,
+        so they are saved along with the library, and get_dequantized() or dequantize() restore double precision values.
+        Note that setting values on a quantized property, as in lib[quantity] = values, replaces it with a new
+        double precision property, and that a ValueError is raised if the data exceeds the range of a floating-point type
+        or has nonzero values too small to be represented as normal numbers (below about 6e-5 for np.float16),
+        which rules out np.float16 for data such as trace mass fractions.
+
+        Parameters
+        ----------
+        quantity: str
+            the name of the property
+        dtype: np.dtype
+            the reduced-precision type, np.float16 (default), np.float32, np.uint8, or np.uint16
+        """
+        dtype = np.dtype(dtype)
+        values = self.get_dequantized(quantity)
+        if dtype.kind not in 'fu' or dtype.itemsize >= values.dtype.itemsize:
+            raise ValueError(f'Library.quantize() requires a floating-point or unsigned integer type '
+                             f'smaller than that of the "{quantity}" data, received {dtype}')
+        if dtype.kind == 'u':
+            offset = float(np.min(values))
+            scale = (float(np.max(values)) - offset) / np.iinfo(dtype).max
+            scale = 1. if scale == 0. else scale
+            self._props[quantity] = np.rint((values - offset) / scale).astype(dtype)
+        else:
+            if np.max(np.abs(values)) > np.finfo(dtype).max:
+                raise ValueError(f'Library.quantize() cannot represent the "{quantity}" data with {dtype}, '
+                                 f'its magnitude exceeds the maximum value of {np.finfo(dtype).max}')
+            nonzero_magnitudes = np.abs(values[values != 0.])
+            if nonzero_magnitudes.size and np.min(nonzero_magnitudes) < np.finfo(dtype).tiny:
+                raise ValueError(f'Library.quantize() cannot represent the "{quantity}" data with {dtype}, '
+                                 f'it has nonzero values smaller than the minimum normal value of {np.finfo(dtype).tiny}')
+            offset = 0.
+            scale = 1.
+            self._props[quantity] = values.astype(dtype)
+        self._extra_attributes[quantity + _QUANTIZATION_SUFFIX] = dict(scale=scale, offset=offset, dtype=dtype.name)
+
+    def _drop_quantization(self, quantity):
+        """Remove a quantized property so that it can be replaced with double precision values"""
+        if self._extra_attributes.pop(quantity + _QUANTIZATION_SUFFIX, None) is not None:
+            self._props.pop(quantity)
+
+    def get_dequantized(self, quantity):
+        """Obtain the double precision values of a property that may have been quantized (see quantize())"""
+        values = self._props[quantity]
+        qmeta = self._extra_attributes.get(quantity + _QUANTIZATION_SUFFIX)
+        if qmeta is None:
+            return values
+        else:
+            return values.astype(np.float64) * qmeta['scale'] + qmeta['offset']
+
+    def dequantize(self, *quantities):
+        """Restore quantized properties (argument list of strings) to double precision in the library"""
+        for quantity in quantities:
+            self._props[quantity] = self.get_dequantized(quantity)
+            self._extra_attributes.pop(quantity + _QUANTIZATION_SUFFIX, None)
@@ -889,7 +889,7 @@ try:
 
 
     def _extend_presumed_pdf_first_dim(lam_lib, pdf_spec, added_suffix, num_procs, verbose=False):
-        turb_dims = [Dimension(d.name + added_suffix, d.values, d.log_scaled) for d in lam_lib.dims]
+        turb_dims = [Dimension(d.name + added_suffix, d.values, d.log_scaled, copy=False) for d in lam_lib.dims]
         if pdf_spec.pdf != 'delta':
             turb_dims.append(Dimension(pdf_spec.variance_name,
                                        pdf_spec.scaled_variance_values if pdf_spec.scaled_variance_values is not None else pdf_spec.variance_values,
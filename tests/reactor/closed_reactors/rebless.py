@@ -1,5 +1,5 @@
-import pickle
 from os.path import abspath, join
+import numpy as np
 
 
 def run():
@@ -32,6 +32,6 @@ def run():
 
 if __name__ == '__main__':
     output = run()
-    gold_pkl = abspath(join('tests', 'reactor', 'closed_reactors', 'gold.pkl'))
-    with open(gold_pkl, 'wb') as file_output:
-        pickle.dump(output, file_output)
+    gold_npz = abspath(join('tests', 'reactor', 'closed_reactors', 'gold.npz'))
+    np.savez(gold_npz, **{f'{key}__{quantity}': np.ascontiguousarray(values)
+                          for key in output for quantity, values in zip(['t', 'T', 'Y'], output[key])})
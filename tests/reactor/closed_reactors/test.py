@@ -1,7 +1,7 @@
-import pickle
 import unittest
 from os.path import join, abspath
 
+import numpy as np
 from numpy.testing import assert_allclose
 
 from tests.reactor.closed_reactors.rebless import run
@@ -16,13 +16,11 @@ if cantera_version_check('atleast', 2, 5, None):
             gold_file = abspath(join('tests',
                                      'reactor',
                                      'closed_reactors',
-                                     'gold.pkl'))
-            with open(gold_file, 'rb') as gold_input:
-                gold_output = pickle.load(gold_input)
-
+                                     'gold.npz'))
+            with np.load(gold_file) as gold_output:
                 for key in output:
                     t, T, Y = output[key]
-                    gold_t, gold_T, gold_Y = gold_output[key]
+                    gold_t, gold_T, gold_Y = gold_output[f'{key}__t'], gold_output[f'{key}__T'], gold_output[f'{key}__Y']
                     self.assertIsNone(assert_allclose(t, gold_t, atol=1.e-8, rtol=1.e-4))
                     self.assertIsNone(assert_allclose(T, gold_T, atol=1.e-8, rtol=1.e-4))
                     self.assertIsNone(assert_allclose(Y, gold_Y, atol=1.e-8, rtol=1.e-4))
@@ -0,0 +1,100 @@
+import unittest
+from spitfire import Library, Dimension
+import numpy as np
+from os import remove
+from os.path import isfile
+
+
+class Quantize(unittest.TestCase):
+    def _make_library(self):
+        l1 = Library(Dimension('x', np.linspace(0, 1, 16)),
+                     Dimension('y', np.linspace(1, 2, 8)))
+        l1['f'] = 300. + 1500. * np.exp(l1.x_grid) * np.cos(np.pi * l1.y_grid) ** 2
+        return l1
+
+    def test_float16(self):
+        l1 = self._make_library()
+        gold = np.copy(l1['f'])
+        l1.quantize('f')
+        self.assertEqual(l1['f'].dtype, np.float16)
+        self.assertTrue(np.all(np.abs(l1.get_dequantized('f') - gold) / gold < 1.e-3))
+
+    def test_uint16(self):
+        l1 = self._make_library()
+        gold = np.copy(l1['f'])
+        l1.quantize('f', np.uint16)
+        self.assertEqual(l1['f'].dtype, np.uint16)
+        tolerance = (gold.max() - gold.min()) / np.iinfo(np.uint16).max
+        self.assertTrue(np.all(np.abs(l1.get_dequantized('f') - gold) <= tolerance))
+
+        l2 = l1[2:6, :]
+        self.assertTrue(np.all(np.abs(l2.get_dequantized('f') - gold[2:6, :]) <= tolerance))
+
+        l1.dequantize('f')
+        self.assertEqual(l1['f'].dtype, np.float64)
+        self.assertTrue(np.all(np.abs(l1['f'] - gold) <= tolerance))
+        self.assertFalse('f__qmeta' in l1.extra_attributes)
+
+    def test_save_and_load(self):
+        file_name = 'l1test.pkl'
+        if isfile(file_name):
+            remove(file_name)
+
+        l1 = self._make_library()
+        l1.quantize('f', np.uint8)
+        l1.save_to_file(file_name)
+        l2 = Library.load_from_file(file_name)
+        remove(file_name)
+
+        self.assertEqual(l2['f'].dtype, np.uint8)
+        self.assertTrue(np.all(l1.get_dequantized('f') == l2.get_dequantized('f')))
+
+    def test_overflow(self):
+        l1 = self._make_library()
+        l1['p'] = 101325.
+        self.assertRaises(ValueError, l1.quantize, 'p')
+        self.assertEqual(l1['p'].dtype, np.float64)
+        self.assertFalse('p__qmeta' in l1.extra_attributes)
+        l1.quantize('p', np.float32)
+        self.assertTrue(np.all(l1.get_dequantized('p') == 101325.))
+
+    def test_underflow(self):
+        l1 = self._make_library()
+        l1['Y'] = 1.e-9 * l1.x_grid
+        self.assertRaises(ValueError, l1.quantize, 'Y')
+        self.assertEqual(l1['Y'].dtype, np.float64)
+        self.assertFalse('Y__qmeta' in l1.extra_attributes)
+        l1.quantize('Y', np.float32)
+        self.assertTrue(np.all(np.abs(l1.get_dequantized('Y') - 1.e-9 * l1.x_grid) <= 1.e-7 * 1.e-9))
+
+    def test_requantize(self):
+        l1 = self._make_library()
+        gold = np.copy(l1['f'])
+        l1.quantize('f', np.uint8)
+        l1.quantize('f', np.float16)
+        self.assertEqual(l1['f'].dtype, np.float16)
+        tolerance = (gold.max() - gold.min()) / np.iinfo(np.uint8).max
+        self.assertTrue(np.all(np.abs(l1.get_dequantized('f') - gold) <= tolerance + 1.e-3 * gold))
+
+    def test_set_quantized(self):
+        l1 = self._make_library()
+        l1.quantize('f', np.uint16)
+        gold = 400. + 1500. * l1.x_grid * l1.y_grid
+        l1['f'] = gold
+        self.assertEqual(l1['f'].dtype, np.float64)
+        self.assertFalse('f__qmeta' in l1.extra_attributes)
+        self.assertTrue(np.all(l1.get_dequantized('f') == gold))
+
+        l1.quantize('f', np.float16)
+        l1['f'] = 2.
+        self.assertEqual(l1['f'].dtype, np.float64)
+        self.assertTrue(np.all(l1.get_dequantized('f') == 2.))
+
+    def test_invalid_type(self):
+        l1 = self._make_library()
+        self.assertRaises(ValueError, l1.quantize, 'f', np.int16)
+        self.assertRaises(ValueError, l1.quantize, 'f', np.float64)
+
+
+if __name__ == '__main__':
+    unittest.main()
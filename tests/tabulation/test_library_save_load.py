@@ -1,10 +1,12 @@
 import unittest
 from spitfire import Library, Dimension
 import numpy as np
-from os import remove
+from os import remove, listdir, rename
 from shutil import rmtree
 from os.path import isfile
 import pickle
+import json
+from unittest.mock import patch
 
 machine_epsilon = np.finfo(float).eps
 
@@ -116,6 +118,34 @@ class SaveAndLoad(unittest.TestCase):
         self.assertTrue(np.all(np.abs(l1['g'] - l2['g']) < 10. * machine_epsilon))
         self.assertTrue(l1.extra_attributes['name'] == l2.extra_attributes['name'])
 
+    def test_save_and_load_npz(self):
+        for compressed in [False, True]:
+            file_name = 'l1test.npz'
+            if isfile(file_name):
+                remove(file_name)
+
+            l1 = Library(Dimension('x', np.linspace(0, 1, 16)),
+                         Dimension('y', np.logspace(1, 2, 8), log_scaled=True),
+                         Dimension('z', np.linspace(2, 3, 4)))
+            l1['f'] = l1.x_grid + l1.y_grid + l1.z_grid
+            l1['g h'] = np.exp(l1.x_grid) * np.cos(np.pi * 2. * l1.y_grid) * l1.z_grid
+            l1.extra_attributes['name'] = 'my_library_name'
+            l1.extra_attributes['values'] = np.array([1., 2.])
+
+            l1.save_to_npz(file_name, compressed=compressed)
+            l2 = Library.load_from_npz(file_name)
+            remove(file_name)
+
+            self.assertEqual(l1.dim_names, l2.dim_names)
+            self.assertEqual(l1.props, l2.props)
+            self.assertTrue(np.all(np.abs(l1.y_grid - l2.y_grid) < 10. * machine_epsilon))
+            self.assertTrue(np.all(np.abs(l1['f'] - l2['f']) < 10. * machine_epsilon))
+            self.assertTrue(np.all(np.abs(l1['g h'] - l2['g h']) < 10. * machine_epsilon))
+            self.assertTrue(l1.extra_attributes['name'] == l2.extra_attributes['name'])
+            self.assertTrue(l2.extra_attributes['values'] == [1., 2.])
+            self.assertFalse(l2.dim('x').log_scaled)
+            self.assertTrue(l2.dim('y').log_scaled)
+
     def test_save_to_text(self):
         xvalues = np.linspace(0, 1, 16)
         yvalues = np.linspace(1, 2, 8)
@@ -146,7 +176,7 @@ class SaveAndLoad(unittest.TestCase):
         gread = np.loadtxt(dir_name + f'/bulkdata_dvar_g.txt').reshape(lib_shape, order='F')
 
         with open(dir_name + '/metadata_user_defined_attributes.txt', 'r') as f:
-            ea_read = f.readline()
+            ea_read = json.load(f)
         with open(dir_name + '/metadata_independent_variables.txt', 'r') as f:
             iv_lines = f.readlines()
         with open(dir_name + '/metadata_dependent_variables.txt', 'r') as f:
@@ -159,10 +189,108 @@ class SaveAndLoad(unittest.TestCase):
         self.assertTrue(np.all(np.abs(zvalues - zread) < 100. * machine_epsilon))
         self.assertTrue(np.all(np.abs(fvalues - fread) < 100. * machine_epsilon))
         self.assertTrue(np.all(np.abs(gvalues - gread) < 100. * machine_epsilon))
-        self.assertTrue(ea_read, str(l1.extra_attributes))
+        self.assertEqual(ea_read, l1.extra_attributes)
         self.assertTrue(all([ivf.strip() == ivn for (ivf, ivn) in zip(iv_lines, [d.name for d in l1.dims])]))
         self.assertTrue(all([dvf.strip() == dvn.replace(' ', '_') for (dvf, dvn) in zip(dv_lines, l1.props)]))
 
+    def test_save_to_binary(self):
+        xvalues = np.linspace(0, 1, 16)
+        yvalues = np.linspace(1, 2, 8)
+        l1 = Library(Dimension('x', xvalues),
+                     Dimension('y', yvalues))
+
+        fvalues = l1.x_grid + l1.y_grid
+        gvalues = np.exp(l1.x_grid) * np.cos(np.pi * 2. * l1.y_grid)
+
+        lib_shape = fvalues.shape
+
+        l1['f'] = fvalues
+        l1['g h'] = gvalues
+        l1.extra_attributes['name'] = 'my_library_name'
+
+        dir_name = 'out_binary'
+
+        l1.save_to_binary_directory(dir_name, ravel_order='F')
+
+        xread = np.load(dir_name + f'/bulkdata_ivar_x.npy')
+        yread = np.load(dir_name + f'/bulkdata_ivar_y.npy')
+        fread = np.load(dir_name + f'/bulkdata_dvar_f.npy').reshape(lib_shape, order='F')
+        gread = np.load(dir_name + f'/bulkdata_dvar_g_h.npy', mmap_mode='r').reshape(lib_shape, order='F')
+
+        with open(dir_name + '/metadata_user_defined_attributes.txt', 'r') as f:
+            ea_read = json.load(f)
+        with open(dir_name + '/metadata_dependent_variables.txt', 'r') as f:
+            dv_lines = f.readlines()
+
+        self.assertTrue(np.all(xvalues == xread))
+        self.assertTrue(np.all(yvalues == yread))
+        self.assertTrue(np.all(fvalues == fread))
+        self.assertTrue(np.all(gvalues == gread))
+        del gread
+
+        rmtree(dir_name)
+
+        self.assertEqual(ea_read, l1.extra_attributes)
+        self.assertEqual([dvf.strip() for dvf in dv_lines], ['f', 'g_h'])
+
+    def test_overwrite_directory(self):
+        l1 = Library(Dimension('x', np.linspace(0, 1, 16)))
+        l1['f'] = l1.x_grid
+
+        dir_name = 'out_overwrite'
+
+        l1.save_to_binary_directory(dir_name)
+        l1['f'] = 2. * l1.x_grid
+        with patch('builtins.input', return_value='y'):
+            l1.save_to_binary_directory(dir_name)
+
+        fread = np.load(dir_name + '/bulkdata_dvar_f.npy')
+        leftovers = [f for f in listdir('.') if f.startswith(dir_name + '.')]
+        rmtree(dir_name)
+
+        self.assertTrue(np.all(fread == l1['f']))
+        self.assertEqual(leftovers, [])
+
+    def test_failed_publish_cleanup(self):
+        l1 = Library(Dimension('x', np.linspace(0, 1, 16)))
+        l1['f'] = l1.x_grid
+
+        file_name = 'out_existing_file'
+        with open(file_name, 'w') as f:
+            f.write('not a directory')
+
+        with self.assertRaises(OSError):
+            l1.save_to_binary_directory(file_name)
+        leftovers = [f for f in listdir('.') if f.startswith(file_name + '.')]
+        still_a_file = isfile(file_name)
+        remove(file_name)
+
+        self.assertTrue(still_a_file)
+        self.assertEqual(leftovers, [])
+
+    def test_failed_publish_restores_directory(self):
+        l1 = Library(Dimension('x', np.linspace(0, 1, 16)))
+        l1['f'] = l1.x_grid
+
+        dir_name = 'out_restore'
+        l1.save_to_binary_directory(dir_name)
+
+        def fail_publishing(source, destination):
+            if '.tmp.' in source:
+                raise OSError('simulated failure')
+            rename(source, destination)
+
+        l1['f'] = 2. * l1.x_grid
+        with patch('builtins.input', return_value='y'), patch('os.rename', side_effect=fail_publishing):
+            self.assertRaises(OSError, l1.save_to_binary_directory, dir_name)
+
+        fread = np.load(dir_name + '/bulkdata_dvar_f.npy')
+        leftovers = [f for f in listdir('.') if f.startswith(dir_name + '.')]
+        rmtree(dir_name)
+
+        self.assertTrue(np.all(fread == l1.x_values))
+        self.assertEqual(leftovers, [])
+
 
 if __name__ == '__main__':
     unittest.main()
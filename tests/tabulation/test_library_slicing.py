@@ -60,6 +60,12 @@ class Slice1D(unittest.TestCase):
         self.assertTrue(np.all(np.abs(l1['f'] - l4['f']) < 10. * machine_epsilon))
         self.assertTrue(l1.extra_attributes['name'] == l2.extra_attributes['name'])
 
+    def test_get(self):
+        l1 = Library(Dimension('x', np.linspace(0, 1, 16)))
+        l1['f'] = np.exp(l1.x_grid)
+        self.assertTrue(l1.get('f') is l1['f'])
+        self.assertRaises(KeyError, l1.get, 'g')
+
     def test_invalid_number(self):
         l1 = Library(Dimension('x', np.linspace(0, 1, 16)))
         try:
@@ -411,6 +417,43 @@ class Slice3D(unittest.TestCase):
         self.assertTrue(np.all(np.abs(fvals[slices] - g) < 10. * machine_epsilon))
         self.assertTrue(np.all(np.abs(l2['f'] - g) < 10. * machine_epsilon))
 
+    def test_grid_views(self):
+        xvalues = np.linspace(0, 1, 10)
+        yvalues = np.linspace(-1, 1, 4)
+        zvalues = np.logspace(-1, 1, 7)
+        l1 = Library(Dimension('x', xvalues), Dimension('y', yvalues), Dimension('z', zvalues))
+        x_grid, y_grid, z_grid = np.meshgrid(xvalues, yvalues, zvalues, indexing='ij')
+        self.assertTrue(np.all(np.abs(l1.x_grid - x_grid) < 10. * machine_epsilon))
+        self.assertTrue(np.all(np.abs(l1.y_grid - y_grid) < 10. * machine_epsilon))
+        self.assertTrue(np.all(np.abs(l1.z_grid - z_grid) < 10. * machine_epsilon))
+        self.assertFalse(l1.x_grid.flags.writeable)
+
+        l1['f'] = l1.x_grid
+        l1['f'][0, 0, 0] = -1.
+        self.assertTrue(np.abs(l1.x_grid[0, 0, 0] - xvalues[0]) < 10. * machine_epsilon)
+
+        read_only_values = np.exp(l1.x_grid) * np.cos(l1.y_grid)
+        read_only_values.flags.writeable = False
+        l1['g'] = read_only_values
+        self.assertTrue(np.shares_memory(l1['g'], read_only_values))
+
+    def test_set_property_copy(self):
+        l1 = Library(Dimension('x', np.linspace(0, 1, 10)),
+                     Dimension('y', np.linspace(-1, 1, 4)),
+                     Dimension('z', np.logspace(-1, 1, 7)))
+        fvals = np.exp(l1.x_grid) * np.cos(l1.y_grid) * np.log(l1.z_grid)
+        gold = np.copy(fvals)
+
+        l1.set_property('f', fvals)
+        l1.set_property('g', fvals, copy=True)
+        fvals[:, :, :] = 0.
+        self.assertTrue(np.all(np.abs(l1['f']) < 10. * machine_epsilon))
+        self.assertTrue(np.all(np.abs(l1['g'] - gold) < 10. * machine_epsilon))
+
+        l2 = deepcopy(l1)
+        l1['g'][:, :, :] = 0.
+        self.assertTrue(np.all(np.abs(l2['g'] - gold) < 10. * machine_epsilon))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,30 +1,97 @@
 import pickle
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        return lambda f: f
+
+
+@njit(cache=True, fastmath=True)
+def right_hand_side(c, out, k_ab, k_bc):
+    """
+    Computes the right-hand side function for the ODE system.
+
+    Note that time integration requires a function that takes (t, y) as arguments.
+    To accomodate this, we will write a lambda after defining the rate constants,
+    which passes the appropriate y value, output array, and rate constants to this function (and ignores the time).
+
+    This is compiled with Numba when it is available, in which case the rate constants are typed scalars
+    and the result is written into the provided output array instead of building a new one from a list.
+
+    :param c: current concentration vector
+    :param out: output array for the right-hand side, the same size as c
+    :param k_ab: the rate constant of the reaction A -> B
+    :param k_bc: the rate constant of the reaction A + B -> 2C
+    :return: right-hand side of the ODE system (the out array)
+    """
+    q_1 = k_ab * c[0]
+    q_2 = k_bc * c[0] * c[1]
+    out[0] = -q_1 - q_2
+    out[1] = q_1 - q_2
+    out[2] = 2. * q_2
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def right_hand_side_batched(C, out, k_ab, k_bc):
+    """
+    Computes the right-hand side function for a batch of independent ODE systems at once.
+
+    :param C: current concentration vectors, shaped (n_batch, 3)
+    :param out: output array for the right-hand side, shaped like C
+    :param k_ab: the rate constant of the reaction A -> B
+    :param k_bc: the rate constant of the reaction A + B -> 2C
+    :return: right-hand side of each ODE system (the out array)
+    """
+    q_1 = k_ab * C[:, 0]
+    q_2 = k_bc * C[:, 0] * C[:, 1]
+    out[:, 0] = -q_1 - q_2
+    out[:, 1] = q_1 - q_2
+    out[:, 2] = 2. * q_2
+    return out
+
+
+@njit(cache=True)
+def rk4_drive(c0, k_ab, k_bc, h, n):
+    """
+    Integrates the ODE system with the classical RK4 method in a single compiled loop, bypassing odesolve.
+
+    :param c0: initial concentration vector
+    :param k_ab: the rate constant of the reaction A -> B
+    :param k_bc: the rate constant of the reaction A + B -> 2C
+    :param h: the time step size
+    :param n: the number of time steps
+    :return: solution trajectory, shaped (n + 1, 3)
+    """
+    Y = np.empty((n + 1, 3))
+    Y[0] = c0
+    k1 = np.empty(3)
+    k2 = np.empty(3)
+    k3 = np.empty(3)
+    k4 = np.empty(3)
+    tmp = np.empty(3)
+    for i in range(n):
+        right_hand_side(Y[i], k1, k_ab, k_bc)
+        for j in range(3):
+            tmp[j] = Y[i, j] + 0.5 * h * k1[j]
+        right_hand_side(tmp, k2, k_ab, k_bc)
+        for j in range(3):
+            tmp[j] = Y[i, j] + 0.5 * h * k2[j]
+        right_hand_side(tmp, k3, k_ab, k_bc)
+        for j in range(3):
+            tmp[j] = Y[i, j] + h * k3[j]
+        right_hand_side(tmp, k4, k_ab, k_bc)
+        for j in range(3):
+            Y[i + 1, j] = Y[i, j] + h * (k1[j] + 2. * k2[j] + 2. * k3[j] + k4[j]) / 6.
+    return Y
 
 
 def run():
+    from itertools import cycle
     from spitfire.time.integrator import odesolve
     from spitfire.time.methods import RK4ClassicalS4P4
-    import numpy as np
-
-    def right_hand_side(c, k_ab, k_bc):
-        """
-        Computes the right-hand side function for the ODE system.
-
-        Note that time integration requires a function that takes (t, y) as arguments.
-        To accomodate this, we will write a lambda after defining the rate constants,
-        which passes the appropriate y value and rate constant to this function (and ignores the time).
-
-        :param c: current concentration vector
-        :param k_ab: the rate constant of the reaction A -> B
-        :param k_bc: the rate constant of the reaction A + B -> 2C
-        :return: right-hand side of the ODE system
-        """
-        c_a = c[0]
-        c_b = c[1]
-        c_c = c[2]
-        q_1 = k_ab * c_a
-        q_2 = k_bc * c_a * c_b
-        return np.array([-q_1 - q_2, q_1 - q_2, 2. * q_2])
 
     c0 = np.array([1., 0., 0.])  # initial condition
     k_ab = 1.  # A -> B rate constant
@@ -32,14 +99,41 @@ def run():
     final_time = 10.  # final time to integrate to
     time_step_size = 0.1  # size of the time step used
 
-    t, sol = odesolve(lambda t, y: right_hand_side(y, k_ab, k_bc),
+    method = RK4ClassicalS4P4()
+
+    # the RK4 method holds on to all of its stages within a step, so we rotate through one output array per stage
+    stage_buffers = cycle(np.empty((method.n_stages, c0.size)))
+
+    t, sol = odesolve(lambda t, y: right_hand_side(y, next(stage_buffers), k_ab, k_bc),
                       c0,
                       stop_at_time=final_time,
                       step_size=time_step_size,
-                      method=RK4ClassicalS4P4(),
+                      method=method,
                       save_each_step=True)
 
-    return dict({'t': t.copy(), 'sol': sol.copy()})
+    # integrate several initial conditions together by flattening the (n_batch, 3) state into one vector
+    c0_batch = np.array([c0, [0.5, 0.5, 0.], [0.2, 0.3, 0.5]])
+    n_batch = c0_batch.shape[0]
+    batch_stage_buffers = cycle(np.empty((method.n_stages, n_batch, c0.size)))
+
+    t_batch, sol_batch = odesolve(
+        lambda t, y: right_hand_side_batched(y.reshape(n_batch, c0.size), next(batch_stage_buffers), k_ab, k_bc).ravel(),
+        c0_batch.ravel(),
+        stop_at_time=final_time,
+        step_size=time_step_size,
+        method=method,
+        save_each_step=True)
+
+    # the same fixed-step RK4 integration, run entirely within one compiled driver
+    n_steps = int(round(final_time / time_step_size))
+    sol_compiled = rk4_drive(c0, k_ab, k_bc, time_step_size, n_steps)
+
+    # integrate each member of the batch on its own, to check every member of the batched integration
+    sol_compiled_batched = np.stack([rk4_drive(c, k_ab, k_bc, time_step_size, n_steps) for c in c0_batch], axis=1)
+
+    return dict({'t': t.copy(), 'sol': sol.copy(),
+                 't_batched': t_batch.copy(), 'sol_batched': sol_batch.reshape(-1, n_batch, c0.size).copy(),
+                 'sol_compiled': sol_compiled, 'sol_compiled_batched': sol_compiled_batched})
 
 
 if __name__ == '__main__':
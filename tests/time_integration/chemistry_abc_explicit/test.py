@@ -19,6 +19,18 @@ class Test(unittest.TestCase):
             gold_output = pickle.load(gold_input)
             self.assertIsNone(assert_allclose(output['t'], gold_output['t'], atol=1.e-8))
             self.assertIsNone(assert_allclose(output['sol'], gold_output['sol'], atol=1.e-8))
+            self.assertIsNone(assert_allclose(output['t_batched'], gold_output['t'], atol=1.e-8))
+            self.assertIsNone(assert_allclose(output['sol_batched'][:, 0, :], gold_output['sol'], atol=1.e-8))
+
+            # odesolve may finish with a vanishingly small step to land on the final time, which the fixed-step driver does not take
+            n_compiled = output['sol_compiled'].shape[0]
+            self.assertIsNone(assert_allclose(output['sol_compiled'], gold_output['sol'][:n_compiled], atol=1.e-8))
+            self.assertIsNone(assert_allclose(output['sol_compiled'][-1], gold_output['sol'][-1], atol=1.e-8))
+
+            sol_batched = output['sol_batched']
+            sol_compiled_batched = output['sol_compiled_batched']
+            self.assertIsNone(assert_allclose(sol_batched[:n_compiled], sol_compiled_batched, atol=1.e-8))
+            self.assertIsNone(assert_allclose(sol_batched[-1], sol_compiled_batched[-1], atol=1.e-8))
 
 
 if __name__ == '__main__':
@@ -76,12 +76,41 @@ class TestOrderOfAccuracy(unittest.TestCase):
     pass
 
 
+class TestStateAndRightHandSideTypes(unittest.TestCase):
+    def test_rk4_classical(self):
+        output = RK4ClassicalS4P4().single_step(array([0., 0.]), 0., 0.1, lambda t, y: array([1, 0]))
+        self.assertTrue(abs(output.solution_update[0] - 0.1) < 1.e-14)
+        self.assertTrue(abs(output.solution_update[1]) < 1.e-14)
+
+    def test_rk4_classical_float32_rhs(self):
+        stage_dtypes = []
+
+        def rhs(t, y):
+            stage_dtypes.append(y.dtype)
+            return array([1., 0.], dtype='float32')
+
+        output = RK4ClassicalS4P4().single_step(array([0., 0.]), 0., 0.1, rhs)
+        self.assertEqual(stage_dtypes, ['float64'] * 4)
+        self.assertEqual(output.solution_update.dtype, 'float64')
+        self.assertTrue(abs(output.solution_update[0] - 0.1) < 1.e-14)
+
+    def test_rk4_classical_complex_state(self):
+        output = RK4ClassicalS4P4().single_step(array([1. + 1.j, 0.]), 0., 0.1, lambda t, y: array([1., 0.]))
+        self.assertTrue(abs(output.solution_update[0] - 0.1) < 1.e-14)
+        self.assertTrue(abs(output.solution_update[1]) < 1.e-14)
+
+        output = RK4ClassicalS4P4().single_step(array([1. + 1.j, 0.]), 0., 0.1, lambda t, y: -y)
+        gold = (exp(-0.1) - 1.) * array([1. + 1.j, 0.])
+        self.assertTrue(all(abs(output.solution_update - gold) < 1.e-6))
+
+
 for method in [ForwardEulerS1P1,
                ExpMidpointS2P2,
                ExpTrapezoidalS2P2Q1,
                ExpRalstonS2P2,
                RK3KuttaS3P3,
                RK4ClassicalS4P4,
+               CarpenterKennedyLowStorageS5P4,
                BogackiShampineS4P3Q2,
                ZonneveldS5P4Q3,
                ExpKennedyCarpetnerS6P4Q3,